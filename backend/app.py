@@ -31,8 +31,11 @@ def create_app():
                 'health': '/api/health',
                 'tickers': '/api/tickers',
                 'articles': '/api/articles',
+                'search': '/api/search',
                 'sentiment_summary': '/api/sentiment/summary',
                 'process': '/api/process',
+                'process_stream': '/api/process/stream',
+                'models': '/api/models',
                 'ticker_latest': '/api/ticker/<ticker>/latest'
             }
         })
@@ -0,0 +1,343 @@
+"""Offline batch runner for summarizing and classifying many articles across CPU cores."""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import List, Dict, Optional, Set
+from backend.config.database import SessionLocal, init_db
+from backend.models.news_article import NewsArticle, TickerConfig
+from backend.services.batch_writer import load_existing, save_articles
+from backend.services.model_registry import get_registry, SUMMARIZATION, SENTIMENT
+from backend.services.news_scraper import NewsScraper
+
+# Per-process state set up by _init_worker
+_worker = {}
+
+
+def load_url_list(path: str, ticker: str) -> List[Dict]:
+    """Read one URL per line, all attributed to the given ticker."""
+    with open(path) as f:
+        return [{'ticker': ticker, 'url': line.strip()} for line in f if line.strip()]
+
+
+def load_csv(path: str, ticker: Optional[str] = None) -> List[Dict]:
+    """
+    Read articles from a CSV with a URL column and optional Ticker, Title and Content columns.
+
+    Column names are matched case-insensitively, so exports such as
+    assetsummaries.csv can be fed back in directly.
+    """
+    items = []
+    with open(path, newline='', encoding='utf-8', errors='replace') as f:
+        for row in csv.DictReader(f):
+            row = {key.strip().lower(): value for key, value in row.items() if key}
+            row_ticker = (row.get('ticker') or ticker or '').upper()
+            if not row.get('url') or not row_ticker:
+                continue
+            items.append({
+                'ticker': row_ticker,
+                'url': row['url'].strip(),
+                'title': row.get('title'),
+                'content': row.get('content')
+            })
+    return items
+
+
+def load_from_db(ticker: Optional[str] = None, since: Optional[datetime] = None) -> List[Dict]:
+    """Read stored articles with content so they can be reprocessed without scraping."""
+    db = SessionLocal()
+    try:
+        query = db.query(NewsArticle).filter(NewsArticle.content.isnot(None))
+        if ticker:
+            query = query.filter_by(ticker=ticker.upper())
+        if since:
+            query = query.filter(NewsArticle.created_at >= since)
+
+        return [
+            {'ticker': a.ticker, 'url': a.url, 'title': a.title, 'content': a.content}
+            for a in query.order_by(NewsArticle.ticker, NewsArticle.id).all()
+        ]
+    finally:
+        db.close()
+
+
+def attach_asset_types(items: List[Dict]):
+    """Add each item's configured asset type so asset-type model routes apply as in the live pipeline."""
+    db = SessionLocal()
+    try:
+        asset_types = {t.ticker: t.asset_type for t in db.query(TickerConfig).all()}
+    finally:
+        db.close()
+
+    for item in items:
+        item['asset_type'] = asset_types.get(item['ticker'])
+
+
+def run_parameters(max_length: int, min_length: int) -> Dict:
+    """Describe the models and summary settings of a run, as stored in its checkpoint."""
+    status = get_registry().status()
+    return {
+        'models': {model['key']: model['model_name'] for model in status['models']},
+        'defaults': status['defaults'],
+        'routes': status['routes'],
+        'max_length': max_length,
+        'min_length': min_length
+    }
+
+
+def load_checkpoint(path: str, params: Dict) -> Set[str]:
+    """
+    Get the URLs already completed by a previous run with the same parameters.
+
+    Raises:
+        ValueError: If the checkpoint was written by a run with other models or summary settings
+    """
+    if not os.path.exists(path):
+        return set()
+
+    completed = set()
+    with open(path) as f:
+        for i, line in enumerate(f):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Partial line left by an interrupted write
+                continue
+
+            if i == 0:
+                if entry.get('params') != params:
+                    raise ValueError(
+                        f"Checkpoint {path} was written with different models or summary settings; "
+                        f"use a new --checkpoint to reprocess, or delete it"
+                    )
+                continue
+
+            if 'url' in entry:
+                completed.add(entry['url'])
+
+    return completed
+
+
+def open_checkpoint(path: str, params: Dict):
+    """Open a checkpoint for appending, writing its parameters header if it is new."""
+    is_new = not os.path.exists(path) or os.path.getsize(path) == 0
+    needs_newline = False
+    if not is_new:
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            needs_newline = f.read(1) != b'\n'
+
+    checkpoint = open(path, 'a')
+    if is_new:
+        checkpoint.write(json.dumps({'params': params}) + '\n')
+    elif needs_newline:
+        # Terminate a partial line so new entries start cleanly
+        checkpoint.write('\n')
+    return checkpoint
+
+
+def _init_worker(torch_threads: int, max_length: int, min_length: int):
+    """Set up a pool process: limit torch threads and prepare its own models."""
+    import torch
+
+    # Each process gets its own share of the cores instead of all of them
+    torch.set_num_threads(torch_threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Already set once parallel work has started in this process
+        pass
+
+    _worker['registry'] = get_registry()
+    _worker['scraper'] = NewsScraper()
+    _worker['max_length'] = max_length
+    _worker['min_length'] = min_length
+
+
+def _process_chunk(items: List[Dict]) -> List[Dict]:
+    """Scrape (if needed), summarize and classify a chunk of articles in a pool process."""
+    registry = _worker['registry']
+    results = []
+
+    for item in items:
+        article = dict(item)
+        try:
+            if not article.get('content'):
+                scraped = _worker['scraper'].scrape_article(article['url'])
+                if scraped is None:
+                    article['error'] = 'Failed to scrape article'
+                    results.append(article)
+                    continue
+                article['title'] = article.get('title') or scraped['title']
+                article['content'] = scraped['content']
+
+            with registry.acquire(SUMMARIZATION, ticker=article['ticker'],
+                                  asset_type=article.get('asset_type')) as summarizer:
+                article['summary'] = summarizer.summarize(
+                    article['content'],
+                    max_length=_worker['max_length'],
+                    min_length=_worker['min_length']
+                )
+            if not article['summary']:
+                article['error'] = 'Failed to summarize article'
+                results.append(article)
+                continue
+
+            with registry.acquire(SENTIMENT, ticker=article['ticker'],
+                                  asset_type=article.get('asset_type')) as sentiment_analyzer:
+                sentiment = sentiment_analyzer.analyze(article['summary'])
+            if sentiment['label'] == 'UNKNOWN':
+                # analyze() reports failures this way; keep any stored label
+                article['error'] = 'Failed to analyze sentiment'
+                results.append(article)
+                continue
+            article['sentiment_label'] = sentiment['label']
+            article['sentiment_score'] = sentiment['score']
+
+        except Exception as e:
+            article['error'] = str(e)
+
+        results.append(article)
+
+    return results
+
+
+def _persist(results: List[Dict], checkpoint) -> int:
+    """Save a chunk's successful results in one transaction, then record them in the checkpoint."""
+    done = [r for r in results if not r.get('error')]
+    for result in results:
+        if result.get('error'):
+            print(f"Skipped {result['url']}: {result['error']}")
+
+    if not done:
+        return 0
+
+    by_ticker = defaultdict(list)
+    for result in done:
+        by_ticker[result['ticker']].append(result)
+
+    db = SessionLocal()
+    try:
+        seen = load_existing(db, [result['url'] for result in done])
+        for ticker, articles in by_ticker.items():
+            save_articles(db, ticker, articles, seen, preloaded=True)
+        db.commit()
+    except Exception as e:
+        print(f"Error saving chunk to database: {e}")
+        db.rollback()
+        return 0
+    finally:
+        db.close()
+
+    # Only committed articles are checkpointed, so a resumed run redoes the rest
+    for result in done:
+        checkpoint.write(json.dumps({'url': result['url'], 'ticker': result['ticker']}) + '\n')
+    checkpoint.flush()
+    os.fsync(checkpoint.fileno())
+    return len(done)
+
+
+def run_batch(items: List[Dict], processes: int, torch_threads: int, chunk_size: int,
+              checkpoint_path: str, max_length: int = 55, min_length: int = 20) -> int:
+    """
+    Process articles across a pool of processes, skipping ones already checkpointed.
+
+    Args:
+        items: Article dictionaries with 'ticker', 'url' and optionally 'title'/'content'
+        processes: Number of pool processes, each with its own models
+        torch_threads: torch intra-op threads per process
+        chunk_size: Articles sent to a process at a time
+        checkpoint_path: JSON lines file of run parameters and completed URLs
+        max_length: Maximum summary length in tokens
+        min_length: Minimum summary length in tokens
+
+    Returns:
+        Number of articles saved in this run
+
+    Raises:
+        ValueError: If the checkpoint belongs to a run with different parameters
+        BrokenProcessPool: If a pool process died, e.g. killed for running out of memory
+    """
+    params = run_parameters(max_length, min_length)
+    completed = load_checkpoint(checkpoint_path, params)
+    pending = [item for item in items if item['url'] not in completed]
+    print(f"{len(items)} articles, {len(items) - len(pending)} already done, {len(pending)} to process")
+    if not pending:
+        return 0
+
+    attach_asset_types(pending)
+
+    # Keep a ticker's articles together so chunks share routed models
+    pending.sort(key=lambda item: item['ticker'])
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    saved = 0
+
+    # A dead worker surfaces as BrokenProcessPool here instead of hanging the run
+    with open_checkpoint(checkpoint_path, params) as checkpoint, ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=_init_worker,
+        initargs=(torch_threads, max_length, min_length)
+    ) as executor:
+        futures = [executor.submit(_process_chunk, chunk) for chunk in chunks]
+        try:
+            for i, future in enumerate(as_completed(futures)):
+                saved += _persist(future.result(), checkpoint)
+                print(f"Chunk {i+1}/{len(chunks)} done, {saved}/{len(pending)} articles saved")
+        except BrokenProcessPool:
+            print(f"A worker process died after {saved} articles were saved; "
+                  f"rerun with the same --checkpoint to resume")
+            raise
+
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Summarize and classify articles in bulk across CPU cores.')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--urls', help='File with one article URL per line (requires --ticker)')
+    source.add_argument('--csv', help='CSV with URL and optional Ticker, Title, Content columns')
+    source.add_argument('--from-db', action='store_true', help='Reprocess stored articles')
+    parser.add_argument('--ticker', help='Ticker for --urls, default for --csv, filter for --from-db')
+    parser.add_argument('--since', help='With --from-db, only articles created since this ISO date')
+    parser.add_argument('--processes', type=int, default=os.cpu_count() or 1, help='Pool processes')
+    parser.add_argument('--torch-threads', type=int, help='torch threads per process (default: cores / processes)')
+    parser.add_argument('--chunk-size', type=int, default=16, help='Articles per task sent to a process')
+    parser.add_argument('--checkpoint', default='batch_checkpoint.jsonl', help='Progress file used to resume; tied to the models and summary settings')
+    parser.add_argument('--max-length', type=int, default=55, help='Maximum summary length in tokens')
+    parser.add_argument('--min-length', type=int, default=20, help='Minimum summary length in tokens')
+    args = parser.parse_args()
+
+    if args.urls and not args.ticker:
+        parser.error('--urls requires --ticker')
+
+    init_db()
+
+    if args.urls:
+        items = load_url_list(args.urls, args.ticker.upper())
+    elif args.csv:
+        items = load_csv(args.csv, args.ticker)
+    else:
+        since = datetime.fromisoformat(args.since) if args.since else None
+        items = load_from_db(args.ticker, since)
+
+    processes = max(1, args.processes)
+    torch_threads = args.torch_threads or max(1, (os.cpu_count() or 1) // processes)
+    print(f"Using {processes} processes with {torch_threads} torch threads each")
+
+    try:
+        saved = run_batch(items, processes, torch_threads, args.chunk_size, args.checkpoint,
+                          max_length=args.max_length, min_length=args.min_length)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"Saved {saved} articles")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,19 @@
 """Database configuration and session management."""
 
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, scoped_session
 from backend.models.news_article import Base
 
 # Database configuration
 DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./news_sentiment.db')
 
+# SQLite tuning: WAL lets dashboard reads proceed while the pipeline writes
+SQLITE_TUNING = os.getenv('SQLITE_TUNING', '1') == '1'
+SQLITE_CACHE_SIZE_MB = int(os.getenv('SQLITE_CACHE_SIZE_MB', 64))
+SQLITE_MMAP_SIZE_MB = int(os.getenv('SQLITE_MMAP_SIZE_MB', 256))
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 30000))
+
 # Create engine
 engine = create_engine(
     DATABASE_URL,
@@ -16,6 +22,21 @@ engine = create_engine(
     connect_args={"check_same_thread": False} if 'sqlite' in DATABASE_URL else {}
 )
 
+
+if 'sqlite' in DATABASE_URL and SQLITE_TUNING:
+    @event.listens_for(engine, 'connect')
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply WAL mode and cache settings to every new SQLite connection."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute(f'PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}')
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f'PRAGMA cache_size=-{SQLITE_CACHE_SIZE_MB * 1024}')
+        cursor.execute(f'PRAGMA mmap_size={SQLITE_MMAP_SIZE_MB * 1024 * 1024}')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Session = scoped_session(SessionLocal)
@@ -23,7 +44,13 @@ Session = scoped_session(SessionLocal)
 
 def init_db():
     """Initialize database and create all tables."""
+    # Register tables defined outside news_article
+    import backend.models.ticker_lease  # noqa: F401
+
     Base.metadata.create_all(bind=engine)
+
+    from backend.services.search_index import init_search_index
+    init_search_index(engine)
     print(f"Database initialized at: {DATABASE_URL}")
 
 
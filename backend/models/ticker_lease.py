@@ -0,0 +1,31 @@
+"""Database model for leases used to share ticker processing across workers."""
+
+from sqlalchemy import Column, Integer, String, DateTime, Text
+from backend.models.news_article import Base
+
+
+class TickerLease(Base):
+    """Work-claiming row for a TickerConfig, held by at most one worker at a time."""
+
+    __tablename__ = 'ticker_leases'
+
+    id = Column(Integer, primary_key=True)
+    ticker = Column(String(20), unique=True, nullable=False, index=True)
+    owner = Column(String(255), nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True, index=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    processed_at = Column(DateTime, nullable=True, index=True)
+    attempts = Column(Integer, default=0)
+    last_error = Column(Text, nullable=True)
+
+    def to_dict(self):
+        """Convert lease to dictionary."""
+        return {
+            'ticker': self.ticker,
+            'owner': self.owner,
+            'lease_expires_at': self.lease_expires_at.isoformat() if self.lease_expires_at else None,
+            'heartbeat_at': self.heartbeat_at.isoformat() if self.heartbeat_at else None,
+            'processed_at': self.processed_at.isoformat() if self.processed_at else None,
+            'attempts': self.attempts,
+            'last_error': self.last_error
+        }
@@ -1,9 +1,14 @@
 """Flask API routes for the news sentiment application."""
 
-from flask import Blueprint, jsonify, request
+import json
+import queue
+import threading
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from backend.models.news_article import NewsArticle, TickerConfig
 from backend.config.database import SessionLocal
 from backend.services.pipeline import NewsPipeline
+from backend.services.model_registry import get_registry
+from backend.services.search_index import search_articles
 from sqlalchemy import desc, func
 from datetime import datetime, timedelta
 
@@ -101,6 +106,54 @@ def get_article(article_id):
         db.close()
 
 
+@api.route('/search', methods=['GET'])
+def search():
+    """
+    Full-text search over article titles, summaries and content.
+
+    Query params:
+        q: Search text, "quoted phrases" match exactly
+        ticker, sentiment: Optional filters
+        start_date, end_date: Optional ISO dates on article creation time
+        limit, offset: Pagination
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Missing search query'}), 400
+
+    limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+    offset = max(request.args.get('offset', 0, type=int), 0)
+
+    try:
+        start_date = request.args.get('start_date')
+        start_date = datetime.fromisoformat(start_date) if start_date else None
+        end_date = request.args.get('end_date')
+        end_date = datetime.fromisoformat(end_date) if end_date else None
+    except ValueError:
+        return jsonify({'error': 'Dates must be in ISO format'}), 400
+
+    db = SessionLocal()
+    try:
+        total, results = search_articles(
+            db, query,
+            ticker=request.args.get('ticker'),
+            sentiment=request.args.get('sentiment'),
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset
+        )
+        return jsonify({
+            'query': query,
+            'total': total,
+            'limit': limit,
+            'offset': offset,
+            'results': results
+        })
+    finally:
+        db.close()
+
+
 @api.route('/sentiment/summary', methods=['GET'])
 def sentiment_summary():
     """Get sentiment summary statistics."""
@@ -139,6 +192,16 @@ def sentiment_summary():
         db.close()
 
 
+def _check_models(models):
+    """Return an error message if requested model overrides are invalid, else None."""
+    registry = get_registry()
+    try:
+        registry.check_models(models or {})
+    except (KeyError, ValueError) as e:
+        return e.args[0]
+    return None
+
+
 @api.route('/process', methods=['POST'])
 def process_news():
     """
@@ -147,14 +210,19 @@ def process_news():
     Body:
         {
             "tickers": ["GME", "TSLA"] or "all",
-            "max_articles": 10
+            "max_articles": 10,
+            "models": {"sentiment": "finbert"}  (optional, overrides routing)
         }
     """
     data = request.json
     tickers = data.get('tickers', 'all')
     max_articles = data.get('max_articles', 10)
 
-    pipeline = NewsPipeline()
+    error = _check_models(data.get('models'))
+    if error:
+        return jsonify({'error': error}), 400
+
+    pipeline = NewsPipeline(models=data.get('models'))
 
     try:
         if tickers == 'all':
@@ -192,6 +260,72 @@ def process_news():
         pipeline.cleanup()
 
 
+@api.route('/process/stream', methods=['POST'])
+def process_news_stream():
+    """
+    Trigger news processing and stream results as server-sent events.
+
+    Body is the same as /process. Emits 'stage' and 'progress' events per
+    ticker, an 'article' event as soon as each article's sentiment is known,
+    'ticker_complete' per ticker, and a final 'done' (or 'error') event.
+    """
+    data = request.json or {}
+    tickers = data.get('tickers', 'all')
+    max_articles = data.get('max_articles', 10)
+
+    error = _check_models(data.get('models'))
+    if error:
+        return jsonify({'error': error}), 400
+
+    events = queue.Queue()
+
+    def run():
+        pipeline = None
+        final = ('error', {'error': 'Processing did not complete'})
+        try:
+            pipeline = NewsPipeline(models=data.get('models'),
+                                    on_event=lambda event, payload: events.put((event, payload)))
+            if tickers == 'all':
+                results = pipeline.process_all_active_tickers(max_articles=max_articles)
+            else:
+                results = {}
+                for ticker in tickers:
+                    results[ticker] = pipeline.process_ticker(ticker, max_articles=max_articles)
+            final = ('done', {'status': 'success', 'processed_tickers': list(results.keys())})
+        except Exception as e:
+            final = ('error', {'error': str(e)})
+        finally:
+            try:
+                # Announce completion only once saves are committed
+                if pipeline is not None:
+                    pipeline.cleanup()
+            except Exception as e:
+                final = ('error', {'error': str(e)})
+            finally:
+                events.put(final)
+                events.put(None)
+
+    # Processing continues to completion even if the client disconnects
+    threading.Thread(target=run, name='process-stream', daemon=True).start()
+
+    def generate():
+        while True:
+            item = events.get()
+            if item is None:
+                break
+            event, payload = item
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@api.route('/models', methods=['GET'])
+def get_models():
+    """Get registered models, routing and resident memory."""
+    return jsonify(get_registry().status())
+
+
 @api.route('/ticker/<ticker>/latest', methods=['GET'])
 def get_ticker_latest(ticker):
     """Get latest articles for a specific ticker."""
@@ -0,0 +1,206 @@
+"""Single writer thread that groups pipeline saves into shared transactions."""
+
+import os
+import time
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import List, Dict
+from backend.models.news_article import NewsArticle
+from backend.config.database import SessionLocal
+from backend.services.search_index import index_articles
+
+
+def load_existing(db, urls: List[str]) -> Dict:
+    """Load stored articles for many URLs in one query, as a url -> NewsArticle map."""
+    if not urls:
+        return {}
+    rows = db.query(NewsArticle).filter(NewsArticle.url.in_(set(urls))).all()
+    return {row.url: row for row in rows}
+
+
+def save_articles(db, ticker: str, articles: List[Dict], seen: Dict = None, preloaded: bool = False):
+    """
+    Insert or update processed articles and their search index entries without committing.
+
+    Args:
+        db: Database session
+        ticker: Stock/crypto ticker symbol
+        articles: Processed article dictionaries
+        seen: Optional url -> NewsArticle map of rows already loaded or added in this transaction
+        preloaded: Whether seen already holds every stored row for these URLs (see load_existing),
+            so URLs missing from it are new and not looked up one by one
+    """
+    seen = seen if seen is not None else {}
+    saved = []
+
+    for article in articles:
+        # Check if article already exists
+        existing = seen.get(article['url'])
+        if existing is None and not preloaded:
+            existing = db.query(NewsArticle).filter_by(url=article['url']).first()
+
+        if existing:
+            # Update existing article
+            existing.summary = article.get('summary')
+            existing.sentiment_label = article.get('sentiment_label')
+            existing.sentiment_score = article.get('sentiment_score')
+            seen[article['url']] = existing
+            saved.append(existing)
+        else:
+            # Create new article
+            news_article = NewsArticle(
+                ticker=ticker,
+                url=article['url'],
+                title=article.get('title'),
+                content=article.get('content'),
+                summary=article.get('summary'),
+                sentiment_label=article.get('sentiment_label'),
+                sentiment_score=article.get('sentiment_score')
+            )
+            db.add(news_article)
+            seen[article['url']] = news_article
+            saved.append(news_article)
+
+    # Assign ids to new rows before indexing them
+    db.flush()
+    index_articles(db, saved)
+
+
+class BatchWriter:
+    """
+    Background writer coalescing article saves.
+
+    Saves submitted from any thread are queued and written by one thread,
+    several at a time in a single transaction. This avoids writers colliding
+    on SQLite and keeps each commit short so reads are not held up.
+    """
+
+    def __init__(self, max_batch: int = 50, max_wait: float = 0.5):
+        """
+        Initialize the writer.
+
+        Args:
+            max_batch: Maximum number of saves grouped into one transaction
+            max_wait: Most seconds a save waits for others to join its batch before it is committed
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the writer thread if it is not running."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='batch-writer', daemon=True)
+                self._thread.start()
+
+    def submit(self, ticker: str, articles: List[Dict]) -> Future:
+        """
+        Queue processed articles for saving.
+
+        Args:
+            ticker: Stock/crypto ticker symbol
+            articles: Processed article dictionaries
+
+        Returns:
+            Future resolved with the number of saved articles once committed;
+            cancelling it before the write starts drops the save
+        """
+        self.start()
+        future = Future()
+        self._queue.put((ticker, articles, future))
+        return future
+
+    def stop(self, timeout: float = 30.0):
+        """Flush queued saves and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _run(self):
+        """Writer loop: collect a batch of saves and commit them together."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            batch = [job]
+            stopping = False
+            # Bound the wait of the first save, however steadily others arrive
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    job = self._queue.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+
+            self._write_batch(batch)
+            if stopping:
+                return
+
+    def _write_batch(self, batch):
+        """Write a batch in one transaction, retrying saves individually if it fails."""
+        # Skip saves cancelled while queued, e.g. by a pipeline that lost its ticker lease
+        batch = [job for job in batch if job[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        db = SessionLocal()
+        try:
+            seen = load_existing(db, [a['url'] for _, articles, _ in batch for a in articles])
+            for ticker, articles, _ in batch:
+                save_articles(db, ticker, articles, seen, preloaded=True)
+            db.commit()
+
+            for _, articles, future in batch:
+                future.set_result(len(articles))
+            return
+
+        except Exception as e:
+            print(f"Error saving batch of {len(batch)} to database: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        # Isolate the failing save so the rest of the batch still lands
+        for ticker, articles, future in batch:
+            db = SessionLocal()
+            try:
+                save_articles(db, ticker, articles)
+                db.commit()
+                future.set_result(len(articles))
+            except Exception as e:
+                print(f"Error saving {ticker} articles to database: {e}")
+                db.rollback()
+                future.set_exception(e)
+            finally:
+                db.close()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> BatchWriter:
+    """Get the process-wide batch writer, flushed automatically on shutdown."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = BatchWriter(
+                max_batch=int(os.getenv('DB_WRITE_BATCH_SIZE', 50)),
+                max_wait=float(os.getenv('DB_WRITE_BATCH_WAIT', 0.5))
+            )
+            atexit.register(_writer.stop)
+        return _writer
@@ -0,0 +1,300 @@
+"""Registry keeping summarization and sentiment models resident within a memory budget."""
+
+import os
+import json
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Optional
+from backend.services.summarizer import NewsSummarizer
+from backend.services.sentiment_analyzer import SentimentAnalyzer
+
+SUMMARIZATION = 'summarization'
+SENTIMENT = 'sentiment'
+
+DEFAULT_SUMMARIZATION_MODEL = 'human-centered-summarization/financial-summarization-pegasus'
+
+# Service class used for each kind of model
+_SERVICES = {
+    SUMMARIZATION: NewsSummarizer,
+    SENTIMENT: SentimentAnalyzer,
+}
+
+
+class ModelRegistry:
+    """
+    Central registry for summarization and sentiment models.
+
+    Models are registered under a key, loaded lazily on first use and kept
+    resident afterwards. When the approximate memory of the resident models
+    exceeds the configured budget, the least recently used models that are
+    not currently in use are unloaded.
+    """
+
+    def __init__(self, memory_budget_mb: int = 0):
+        """
+        Initialize the registry.
+
+        Args:
+            memory_budget_mb: RAM budget for resident models in MB, 0 for unlimited
+        """
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self._specs = {}
+        self._defaults = {}
+        self._routes = {SUMMARIZATION: {}, SENTIMENT: {}}
+        self._resident = OrderedDict()
+        self._footprints = {}
+        self._in_use = {}
+        self._loading = {}
+        self._lock = threading.RLock()
+
+    def register(self, key: str, kind: str, model_name: Optional[str] = None, default: bool = False):
+        """
+        Register a model under a key.
+
+        Args:
+            key: Name used to refer to the model in routes and requests
+            kind: 'summarization' or 'sentiment'
+            model_name: HuggingFace model name, None for the transformers default
+            default: Whether this model is the default for its kind
+        """
+        if kind not in _SERVICES:
+            raise ValueError(f"Unknown model kind: {kind}")
+
+        with self._lock:
+            self._specs[key] = {'kind': kind, 'model_name': model_name}
+            if default or kind not in self._defaults:
+                self._defaults[kind] = key
+
+    def set_route(self, kind: str, selector: str, key: str):
+        """
+        Route a ticker or asset type to a registered model.
+
+        Args:
+            kind: 'summarization' or 'sentiment'
+            selector: Ticker symbol (e.g. 'BTC') or asset type (e.g. 'crypto')
+            key: Registered model key
+        """
+        self.check_key(key, kind)
+        with self._lock:
+            self._routes[kind][selector.upper()] = key
+
+    def resolve(self, kind: str, ticker: Optional[str] = None, asset_type: Optional[str] = None) -> str:
+        """
+        Pick the model key for a ticker, falling back to its asset type and then the default.
+
+        Args:
+            kind: 'summarization' or 'sentiment'
+            ticker: Ticker symbol being processed
+            asset_type: Asset type of the ticker
+
+        Returns:
+            Registered model key
+        """
+        routes = self._routes[kind]
+        for selector in (ticker, asset_type):
+            if selector and selector.upper() in routes:
+                return routes[selector.upper()]
+
+        if kind not in self._defaults:
+            raise KeyError(f"No {kind} model registered")
+        return self._defaults[kind]
+
+    @contextmanager
+    def acquire(self, kind: str, key: Optional[str] = None, ticker: Optional[str] = None,
+                asset_type: Optional[str] = None):
+        """
+        Use a model for the duration of a block, protecting it from eviction.
+
+        Args:
+            kind: 'summarization' or 'sentiment'
+            key: Explicit model key, otherwise resolved from ticker/asset type
+            ticker: Ticker symbol being processed
+            asset_type: Asset type of the ticker
+
+        Yields:
+            Loaded NewsSummarizer or SentimentAnalyzer
+        """
+        key = key or self.resolve(kind, ticker=ticker, asset_type=asset_type)
+        self.check_key(key, kind)
+        service = self._load(key)
+
+        try:
+            yield service
+        finally:
+            with self._lock:
+                self._in_use[key] -= 1
+                if self._in_use[key] == 0:
+                    del self._in_use[key]
+                self._enforce_budget()
+
+    def check_key(self, key: str, kind: str):
+        """Raise KeyError if a key is not registered, ValueError if it is not for the given kind."""
+        spec = self._specs.get(key)
+        if spec is None:
+            raise KeyError(f"Unknown model: {key}")
+        if spec['kind'] != kind:
+            raise ValueError(f"Model {key} is a {spec['kind']} model, not {kind}")
+
+    def check_models(self, models: Dict[str, str]):
+        """
+        Validate per-kind model overrides such as {"sentiment": "finbert"}.
+
+        Raises:
+            KeyError: If a model key is not registered
+            ValueError: If a kind is unknown or a model is of a different kind
+        """
+        if not isinstance(models, dict):
+            raise ValueError("models must map a kind to a model key")
+        for kind, key in models.items():
+            if kind not in _SERVICES:
+                raise ValueError(f"Unknown model kind: {kind}")
+            self.check_key(key, kind)
+
+    def _load(self, key: str):
+        """
+        Return the resident service for a key, loading it if needed, and mark it in use.
+
+        Loading happens outside the registry lock, so other models stay usable
+        meanwhile; concurrent requests for the same key wait for a single load.
+        """
+        while True:
+            with self._lock:
+                if key in self._resident:
+                    self._resident.move_to_end(key)
+                    self._in_use[key] = self._in_use.get(key, 0) + 1
+                    return self._resident[key]
+
+                loading = self._loading.get(key)
+                if loading is None:
+                    spec = self._specs.get(key)
+                    if spec is None:
+                        raise KeyError(f"Unknown model: {key}")
+
+                    loading = self._loading[key] = threading.Event()
+                    # Make room up front when the size is known from a previous load
+                    self._enforce_budget()
+                    break
+
+            # Another thread is loading this model; use it once resident, or retry if that load failed
+            loading.wait()
+
+        try:
+            service_cls = _SERVICES[spec['kind']]
+            service = service_cls(spec['model_name']) if spec['model_name'] else service_cls()
+            service.load_model()
+            footprint = service.memory_footprint()
+        except BaseException:
+            with self._lock:
+                del self._loading[key]
+            loading.set()
+            raise
+
+        with self._lock:
+            del self._loading[key]
+            self._footprints[key] = footprint
+            self._resident[key] = service
+            self._in_use[key] = self._in_use.get(key, 0) + 1
+            print(f"Model {key} resident (~{footprint / 1024 / 1024:.0f} MB)")
+            self._enforce_budget()
+        loading.set()
+        return service
+
+    def _enforce_budget(self):
+        """Unload least recently used idle models until resident and loading models fit the budget."""
+        if not self.memory_budget:
+            return
+
+        # Room for models being loaded whose size is known from a previous load
+        reserve = sum(self._footprints.get(key, 0) for key in self._loading)
+        for key in list(self._resident.keys()):
+            if self.resident_bytes() + reserve <= self.memory_budget:
+                break
+            if key in self._in_use:
+                continue
+            self.unload(key)
+
+    def resident_bytes(self) -> int:
+        """Approximate memory used by resident models in bytes."""
+        return sum(self._footprints.get(key, 0) for key in self._resident)
+
+    def unload(self, key: str):
+        """Unload a resident model."""
+        with self._lock:
+            service = self._resident.pop(key, None)
+            if service is not None:
+                service.unload_model()
+                print(f"Model {key} evicted")
+
+    def unload_all(self):
+        """Unload every idle resident model."""
+        with self._lock:
+            for key in list(self._resident.keys()):
+                if key not in self._in_use:
+                    self.unload(key)
+
+    def status(self) -> Dict:
+        """Describe registered models, routes and memory usage."""
+        with self._lock:
+            return {
+                'memory_budget_mb': self.memory_budget // (1024 * 1024),
+                'resident_mb': round(self.resident_bytes() / 1024 / 1024, 1),
+                'defaults': dict(self._defaults),
+                'routes': {kind: dict(routes) for kind, routes in self._routes.items()},
+                'models': [
+                    {
+                        'key': key,
+                        'kind': spec['kind'],
+                        'model_name': spec['model_name'],
+                        'resident': key in self._resident,
+                        'loading': key in self._loading,
+                        'in_use': self._in_use.get(key, 0),
+                        'memory_mb': round(self._footprints[key] / 1024 / 1024, 1)
+                        if key in self._footprints else None
+                    }
+                    for key, spec in self._specs.items()
+                ]
+            }
+
+    @classmethod
+    def from_env(cls) -> 'ModelRegistry':
+        """
+        Build a registry from environment variables.
+
+        MODEL_MEMORY_BUDGET_MB: RAM budget for resident models (0 = unlimited)
+        SUMMARIZATION_MODEL / SENTIMENT_MODEL: default models ('default' = transformers default)
+        EXTRA_MODELS: JSON, e.g. {"finbert": {"kind": "sentiment", "model_name": "ProsusAI/finbert"}}
+        MODEL_ROUTES: JSON, e.g. {"sentiment": {"crypto": "finbert", "TSLA": "finbert"}}
+        """
+        registry = cls(memory_budget_mb=int(os.getenv('MODEL_MEMORY_BUDGET_MB', 0)))
+
+        summarization_model = os.getenv('SUMMARIZATION_MODEL', DEFAULT_SUMMARIZATION_MODEL)
+        sentiment_model = os.getenv('SENTIMENT_MODEL', 'default')
+        registry.register('default-summarization', SUMMARIZATION,
+                          None if summarization_model == 'default' else summarization_model, default=True)
+        registry.register('default-sentiment', SENTIMENT,
+                          None if sentiment_model == 'default' else sentiment_model, default=True)
+
+        extra_models = json.loads(os.getenv('EXTRA_MODELS', '{}'))
+        for key, spec in extra_models.items():
+            registry.register(key, spec['kind'], spec.get('model_name'), default=spec.get('default', False))
+
+        routes = json.loads(os.getenv('MODEL_ROUTES', '{}'))
+        for kind, selectors in routes.items():
+            for selector, key in selectors.items():
+                registry.set_route(kind, selector, key)
+
+        return registry
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    """Get the process-wide model registry, creating it from the environment on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry.from_env()
+        return _registry
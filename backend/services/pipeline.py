@@ -1,22 +1,43 @@
 """Main pipeline orchestrating news scraping, summarization, and sentiment analysis."""
 
-from typing import List, Dict
+import threading
+from concurrent.futures import CancelledError
+from functools import partial
+from datetime import datetime
+from typing import Callable, List, Dict, Optional
 from backend.services.news_scraper import NewsScraper
-from backend.services.summarizer import NewsSummarizer
-from backend.services.sentiment_analyzer import SentimentAnalyzer
-from backend.models.news_article import NewsArticle, TickerConfig
+from backend.services.model_registry import ModelRegistry, get_registry, SUMMARIZATION, SENTIMENT
+from backend.services.batch_writer import get_writer
+from backend.services.ticker_leases import TickerLeaseManager
+from backend.models.news_article import TickerConfig
 from backend.config.database import SessionLocal
 
 
 class NewsPipeline:
     """Complete pipeline for processing news articles."""
 
-    def __init__(self):
+    def __init__(self, registry: Optional[ModelRegistry] = None, models: Optional[Dict[str, str]] = None,
+                 on_event: Optional[Callable[[str, Dict], None]] = None):
+        """
+        Initialize the pipeline.
+
+        Args:
+            registry: Model registry to use, defaults to the process-wide registry
+            models: Optional model keys per kind overriding routing, e.g. {"sentiment": "finbert"};
+                raises KeyError or ValueError if they are not registered
+            on_event: Optional hook called with (event, data) as processing progresses.
+                Events are 'stage', 'progress', 'article' and 'ticker_complete'.
+        """
         self.scraper = NewsScraper()
-        self.summarizer = NewsSummarizer()
-        self.sentiment_analyzer = SentimentAnalyzer()
+        self.registry = registry or get_registry()
+        self.models = models or {}
+        self.registry.check_models(self.models)
+        self.writer = get_writer()
+        self._pending_saves = []
+        self.on_event = on_event
 
-    def process_ticker(self, ticker: str, max_articles: int = 10, save_to_db: bool = True) -> List[Dict]:
+    def process_ticker(self, ticker: str, max_articles: int = 10, save_to_db: bool = True,
+                       asset_type: Optional[str] = None) -> List[Dict]:
         """
         Process news articles for a ticker.
 
@@ -24,6 +45,7 @@ class NewsPipeline:
             ticker: Stock/crypto ticker symbol
             max_articles: Maximum number of articles to process
             save_to_db: Whether to save results to database
+            asset_type: Asset type used for model routing, looked up if not given
 
         Returns:
             List of processed article dictionaries
@@ -34,103 +56,218 @@ class NewsPipeline:
 
         # Step 1: Scrape news articles
         print(f"[1/3] Scraping news articles...")
+        self._emit('stage', ticker=ticker, stage='scraping')
         articles = self.scraper.scrape_ticker_news(ticker, max_articles=max_articles)
         print(f"Found {len(articles)} articles")
 
         if not articles:
             print(f"No articles found for {ticker}")
+            self._emit('ticker_complete', ticker=ticker, count=0)
             return []
 
+        if asset_type is None:
+            asset_type = self._lookup_asset_type(ticker)
+
         # Step 2: Summarize articles
         print(f"[2/3] Summarizing articles...")
-        self.summarizer.load_model()
-        for i, article in enumerate(articles):
-            summary = self.summarizer.summarize(article['content'])
-            article['summary'] = summary
-            print(f"Summarized article {i+1}/{len(articles)}")
+        self._emit('stage', ticker=ticker, stage='summarizing', total=len(articles))
+        with self.registry.acquire(SUMMARIZATION, key=self.models.get(SUMMARIZATION),
+                                   ticker=ticker, asset_type=asset_type) as summarizer:
+            for i, article in enumerate(articles):
+                summary = summarizer.summarize(article['content'])
+                article['summary'] = summary
+                print(f"Summarized article {i+1}/{len(articles)}")
+                self._emit('progress', ticker=ticker, stage='summarizing', done=i + 1, total=len(articles))
 
         # Step 3: Analyze sentiment
         print(f"[3/3] Analyzing sentiment...")
-        self.sentiment_analyzer.load_model()
-        for i, article in enumerate(articles):
-            sentiment = self.sentiment_analyzer.analyze(article['summary'])
-            article['sentiment_label'] = sentiment['label']
-            article['sentiment_score'] = sentiment['score']
-            print(f"Analyzed sentiment {i+1}/{len(articles)}: {sentiment['label']} ({sentiment['score']:.2f})")
+        self._emit('stage', ticker=ticker, stage='analyzing', total=len(articles))
+        with self.registry.acquire(SENTIMENT, key=self.models.get(SENTIMENT),
+                                   ticker=ticker, asset_type=asset_type) as sentiment_analyzer:
+            for i, article in enumerate(articles):
+                sentiment = sentiment_analyzer.analyze(article['summary'])
+                article['sentiment_label'] = sentiment['label']
+                article['sentiment_score'] = sentiment['score']
+                print(f"Analyzed sentiment {i+1}/{len(articles)}: {sentiment['label']} ({sentiment['score']:.2f})")
+                self._emit('article', ticker=ticker, index=i + 1, total=len(articles), article={
+                    'title': article.get('title'),
+                    'summary': article.get('summary'),
+                    'sentiment_label': article.get('sentiment_label'),
+                    'sentiment_score': article.get('sentiment_score'),
+                    'url': article.get('url')
+                })
 
         # Step 4: Save to database
         if save_to_db:
             print(f"[4/4] Saving to database...")
+            self._emit('stage', ticker=ticker, stage='saving', total=len(articles))
             self._save_to_database(ticker, articles)
-            print(f"Saved {len(articles)} articles to database")
+            print(f"Queued {len(articles)} articles for saving")
 
         print(f"\nCompleted processing {ticker}")
+        self._emit('ticker_complete', ticker=ticker, count=len(articles))
         return articles
 
-    def _save_to_database(self, ticker: str, articles: List[Dict]):
-        """Save processed articles to database."""
-        db = SessionLocal()
+    def _emit(self, event: str, **data):
+        """Send an event to the on_event hook, if any."""
+        if self.on_event is None:
+            return
         try:
-            for article in articles:
-                # Check if article already exists
-                existing = db.query(NewsArticle).filter_by(url=article['url']).first()
-
-                if existing:
-                    # Update existing article
-                    existing.summary = article.get('summary')
-                    existing.sentiment_label = article.get('sentiment_label')
-                    existing.sentiment_score = article.get('sentiment_score')
-                else:
-                    # Create new article
-                    news_article = NewsArticle(
-                        ticker=ticker,
-                        url=article['url'],
-                        title=article.get('title'),
-                        content=article.get('content'),
-                        summary=article.get('summary'),
-                        sentiment_label=article.get('sentiment_label'),
-                        sentiment_score=article.get('sentiment_score')
-                    )
-                    db.add(news_article)
-
-            db.commit()
-
+            self.on_event(event, data)
         except Exception as e:
-            print(f"Error saving to database: {e}")
-            db.rollback()
+            print(f"Error in {event} event hook: {e}")
+
+    def _lookup_asset_type(self, ticker: str) -> Optional[str]:
+        """Get the configured asset type of a ticker, if any."""
+        db = SessionLocal()
+        try:
+            ticker_config = db.query(TickerConfig).filter_by(ticker=ticker.upper()).first()
+            return ticker_config.asset_type if ticker_config else None
         finally:
             db.close()
 
-    def process_all_active_tickers(self, max_articles: int = 10) -> Dict[str, List[Dict]]:
+    def _save_to_database(self, ticker: str, articles: List[Dict]):
+        """Queue processed articles on the batch writer."""
+        self._pending_saves.append(self.writer.submit(ticker, articles))
+
+    def wait_for_saves(self) -> bool:
+        """
+        Block until every queued save from this pipeline has been committed.
+
+        Returns:
+            True if all saves succeeded
+        """
+        pending, self._pending_saves = self._pending_saves, []
+        success = True
+        for future in pending:
+            try:
+                future.result()
+            except CancelledError:
+                # Dropped after its ticker lease was lost
+                continue
+            except Exception as e:
+                print(f"Error saving to database: {e}")
+                success = False
+        return success
+
+    def process_all_active_tickers(self, max_articles: int = 10,
+                                   lease_manager: Optional[TickerLeaseManager] = None,
+                                   due_before: Optional[datetime] = None) -> Dict[str, List[Dict]]:
         """
         Process all active tickers from database.
 
+        Tickers are claimed one at a time through leases, so any number of
+        pipelines in other processes or on other hosts can run the same sweep
+        against the same database without processing a ticker twice.
+
         Args:
             max_articles: Maximum number of articles per ticker
+            lease_manager: Lease manager identifying this worker, created if not given
+            due_before: Only process tickers not processed since this time, defaults to now
 
         Returns:
-            Dictionary mapping ticker to list of processed articles
+            Dictionary mapping ticker to list of processed articles claimed by this pipeline
         """
-        db = SessionLocal()
+        lease_manager = lease_manager or TickerLeaseManager()
+        due_before = due_before or datetime.utcnow()
         results = {}
+        attempted = set()
+        released = []
+        lost_leases = {}
 
         try:
-            # Get all active tickers
-            tickers = db.query(TickerConfig).filter_by(is_active=1).all()
+            lease_manager.sync_tickers()
+
+            while True:
+                ticker_config = lease_manager.claim_next(due_before, exclude=attempted)
+                if ticker_config is None:
+                    break
 
-            for ticker_config in tickers:
                 ticker = ticker_config.ticker
-                articles = self.process_ticker(ticker, max_articles=max_articles)
-                results[ticker] = articles
+                attempted.add(ticker)
+                lost = lost_leases[ticker] = threading.Event()
+                saves = []
+                stop_heartbeat = lease_manager.start_heartbeat(
+                    ticker, on_lost=partial(self._drop_saves, ticker, lost, saves)
+                )
+                pending_before = len(self._pending_saves)
+
+                try:
+                    articles = self.process_ticker(ticker, max_articles=max_articles,
+                                                   asset_type=ticker_config.asset_type)
+                    results[ticker] = articles
+                except Exception as e:
+                    print(f"Error processing {ticker}: {e}")
+                    lease_manager.release(ticker, success=False, error=str(e))
+                    stop_heartbeat.set()
+                    continue
+
+                saves.extend(self._pending_saves[pending_before:])
+                if lost.is_set():
+                    # Another worker owns the ticker now; its results take precedence
+                    self._drop_saves(ticker, lost, saves)
+                    stop_heartbeat.set()
+                    continue
+
+                if not saves:
+                    lease_manager.release(ticker, success=True)
+                    stop_heartbeat.set()
+                    continue
+
+                # Keep the lease until the save commits, without blocking the sweep on it
+                released.append(self._release_when_saved(lease_manager, ticker, saves[-1], stop_heartbeat))
 
         except Exception as e:
             print(f"Error processing tickers: {e}")
-        finally:
-            db.close()
 
-        return results
+        self.wait_for_saves()
+        for event in released:
+            event.wait()
+
+        # Leave out tickers whose results were dropped with a lost lease
+        return {ticker: articles for ticker, articles in results.items() if not lost_leases[ticker].is_set()}
+
+    def _drop_saves(self, ticker: str, lost: threading.Event, saves: List):
+        """Cancel a ticker's saves that have not started writing, after its lease was lost."""
+        lost.set()
+        for save in list(saves):
+            if save.cancel():
+                print(f"Dropped queued save for {ticker} after losing its lease")
+
+    def _release_when_saved(self, lease_manager: TickerLeaseManager, ticker: str, save,
+                            stop_heartbeat: threading.Event) -> threading.Event:
+        """
+        Release a ticker's lease once its save has committed or failed.
+
+        Returns:
+            Event set after the lease has been released
+        """
+        released = threading.Event()
+
+        def on_saved(future):
+            try:
+                if future.cancelled():
+                    # Dropped after the lease was lost, nothing to release
+                    pass
+                elif future.exception() is None:
+                    lease_manager.release(ticker, success=True)
+                else:
+                    lease_manager.release(ticker, success=False, error=f"Failed to save articles: {future.exception()}")
+            finally:
+                stop_heartbeat.set()
+                released.set()
+
+        save.add_done_callback(on_saved)
+        return released
 
     def cleanup(self):
-        """Cleanup models from memory."""
-        self.summarizer.unload_model()
-        self.sentiment_analyzer.unload_model()
+        """
+        Wait for pending saves and release models after processing.
+
+        Models stay resident in the shared registry for the next request; with a
+        memory budget configured, idle models beyond the budget are unloaded.
+        Without a budget, models are unloaded as before.
+        """
+        self.wait_for_saves()
+        if not self.registry.memory_budget:
+            self.registry.unload_all()
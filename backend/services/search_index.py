@@ -0,0 +1,164 @@
+"""Full-text search over article titles, summaries and content."""
+
+import re
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
+from sqlalchemy import text, func, literal_column, literal, or_, table, column
+from backend.models.news_article import NewsArticle
+
+ARTICLES_TABLE = NewsArticle.__tablename__
+FTS_TABLE = f'{ARTICLES_TABLE}_fts'
+SEARCH_VECTOR = f'{ARTICLES_TABLE}.search_vector'
+
+# Relative weight of matches in title, summary and content
+SQLITE_BM25_WEIGHTS = '10.0, 5.0, 1.0'
+POSTGRES_SEARCH_VECTOR = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(summary, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(content, '')), 'C')"
+)
+
+_fts_table = table(FTS_TABLE, column('rowid'))
+
+
+def init_search_index(engine):
+    """
+    Create the full-text index if needed and index articles missing from it.
+
+    SQLite uses an FTS5 table keyed by article id; PostgreSQL uses a weighted
+    tsvector column with a GIN index. Other databases fall back to LIKE search.
+    """
+    dialect = engine.dialect.name
+
+    with engine.begin() as conn:
+        if dialect == 'sqlite':
+            conn.execute(text(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+                f"USING fts5(title, summary, content, tokenize='porter unicode61')"
+            ))
+            conn.execute(text(
+                f"INSERT INTO {FTS_TABLE} (rowid, title, summary, content) "
+                f"SELECT id, title, summary, content FROM {ARTICLES_TABLE} "
+                f"WHERE id NOT IN (SELECT rowid FROM {FTS_TABLE})"
+            ))
+        elif dialect == 'postgresql':
+            conn.execute(text(
+                f"ALTER TABLE {ARTICLES_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector"
+            ))
+            conn.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_{ARTICLES_TABLE}_search_vector "
+                f"ON {ARTICLES_TABLE} USING GIN (search_vector)"
+            ))
+            conn.execute(text(
+                f"UPDATE {ARTICLES_TABLE} SET search_vector = {POSTGRES_SEARCH_VECTOR} "
+                f"WHERE search_vector IS NULL"
+            ))
+
+
+def index_articles(db, articles: List[NewsArticle]):
+    """
+    Update the full-text index for saved articles within the current transaction.
+
+    Args:
+        db: Database session the articles were added or updated in
+        articles: Flushed NewsArticle rows
+    """
+    if not articles:
+        return
+
+    dialect = db.bind.dialect.name
+
+    if dialect == 'sqlite':
+        # One row per id even if an article was saved twice in the batch
+        params = list({
+            article.id: {
+                'id': article.id,
+                'title': article.title,
+                'summary': article.summary,
+                'content': article.content
+            }
+            for article in articles
+        }.values())
+        db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), [{'id': p['id']} for p in params])
+        db.execute(text(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, summary, content) "
+            f"VALUES (:id, :title, :summary, :content)"
+        ), params)
+    elif dialect == 'postgresql':
+        db.execute(text(
+            f"UPDATE {ARTICLES_TABLE} SET search_vector = {POSTGRES_SEARCH_VECTOR} WHERE id = ANY(:ids)"
+        ), {'ids': [article.id for article in articles]})
+
+
+def _fts5_query(query: str) -> str:
+    """Turn free text into an FTS5 query matching all words and "quoted phrases"."""
+    terms = []
+    for phrase, word in re.findall(r'"([^"]+)"|(\S+)', query):
+        term = (phrase or word).replace('"', '""')
+        terms.append(f'"{term}"')
+    return ' '.join(terms)
+
+
+def search_articles(db, query: str, ticker: Optional[str] = None, sentiment: Optional[str] = None,
+                    start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                    limit: int = 20, offset: int = 0) -> Tuple[int, List[Dict]]:
+    """
+    Search articles by keyword, best matches first.
+
+    Args:
+        db: Database session
+        query: Search text; all words must match, "quoted phrases" match exactly
+        ticker: Optional ticker filter
+        sentiment: Optional sentiment label filter
+        start_date: Only articles created at or after this time
+        end_date: Only articles created before this time
+        limit: Maximum number of results
+        offset: Number of results to skip
+
+    Returns:
+        Total number of matches and the requested page of article dictionaries with 'rank'
+    """
+    dialect = db.bind.dialect.name
+
+    if dialect == 'sqlite':
+        # bm25() is lower for better matches
+        rank = (-literal_column(f'bm25({FTS_TABLE}, {SQLITE_BM25_WEIGHTS})')).label('rank')
+        q = db.query(NewsArticle, rank).join(
+            _fts_table, _fts_table.c.rowid == NewsArticle.id
+        ).filter(text(f'{FTS_TABLE} MATCH :query')).params(query=_fts5_query(query))
+    elif dialect == 'postgresql':
+        tsquery = func.websearch_to_tsquery('english', query)
+        search_vector = literal_column(SEARCH_VECTOR)
+        rank = func.ts_rank_cd(search_vector, tsquery).label('rank')
+        q = db.query(NewsArticle, rank).filter(search_vector.op('@@')(tsquery))
+    else:
+        rank = literal(0.0).label('rank')
+        pattern = f'%{query}%'
+        q = db.query(NewsArticle, rank).filter(or_(
+            NewsArticle.title.ilike(pattern),
+            NewsArticle.summary.ilike(pattern),
+            NewsArticle.content.ilike(pattern)
+        ))
+
+    if ticker:
+        q = q.filter(NewsArticle.ticker == ticker.upper())
+
+    if sentiment:
+        q = q.filter(NewsArticle.sentiment_label == sentiment.upper())
+
+    if start_date:
+        q = q.filter(NewsArticle.created_at >= start_date)
+
+    if end_date:
+        q = q.filter(NewsArticle.created_at < end_date)
+
+    total = q.count()
+    rows = q.order_by(rank.desc(), NewsArticle.created_at.desc()).limit(limit).offset(offset).all()
+
+    results = []
+    for article, score in rows:
+        result = article.to_dict()
+        result['rank'] = round(float(score), 4)
+        results.append(result)
+
+    return total, results
@@ -45,8 +45,9 @@ class SentimentAnalyzer:
             text = text[:2000]
             result = self.pipeline(text)[0]
 
+            # Models disagree on case (e.g. FinBERT returns 'positive'), store one form
             return {
-                'label': result['label'],
+                'label': result['label'].upper(),
                 'score': round(result['score'], 4)
             }
 
@@ -77,6 +78,12 @@ class SentimentAnalyzer:
 
         return results
 
+    def memory_footprint(self) -> int:
+        """Approximate memory used by the loaded model in bytes."""
+        if self.pipeline is None:
+            return 0
+        return self.pipeline.model.get_memory_footprint()
+
     def unload_model(self):
         """Unload model from memory."""
         if self.pipeline is not None:
@@ -89,6 +89,12 @@ class NewsSummarizer:
 
         return summaries
 
+    def memory_footprint(self) -> int:
+        """Approximate memory used by the loaded model in bytes."""
+        if self.model is None:
+            return 0
+        return self.model.get_memory_footprint()
+
     def unload_model(self):
         """Unload model from memory to free resources."""
         if self.model is not None:
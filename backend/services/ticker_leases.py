@@ -0,0 +1,205 @@
+"""Lease-based claiming of tickers so several workers can share one database."""
+
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Iterable
+from sqlalchemy import or_, and_, case
+from sqlalchemy.exc import IntegrityError
+from backend.models.news_article import TickerConfig
+from backend.models.ticker_lease import TickerLease
+from backend.config.database import SessionLocal
+
+
+def make_worker_id() -> str:
+    """Build a worker identifier unique across hosts and processes."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class TickerLeaseManager:
+    """
+    Claims tickers for processing through the ticker_leases table.
+
+    A worker claims a ticker with a conditional UPDATE that only succeeds when
+    no other worker holds a live lease, so claiming is safe across processes
+    and hosts on both SQLite and PostgreSQL. Leases are extended by a heartbeat
+    while the ticker is processed; if a worker crashes its lease expires and
+    the ticker becomes claimable again. A ticker that keeps failing is claimed
+    at most max_attempts times per sweep and then waits for the next one.
+    """
+
+    def __init__(self, worker_id: Optional[str] = None, lease_seconds: int = 300, max_attempts: int = 3):
+        """
+        Initialize the lease manager.
+
+        Args:
+            worker_id: Identifier of this worker, generated if not given
+            lease_seconds: How long a claim stays valid without a heartbeat
+            max_attempts: Claims of a ticker per sweep before it is left for the next sweep
+        """
+        self.worker_id = worker_id or make_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+    def sync_tickers(self):
+        """Create lease rows for active tickers that do not have one yet."""
+        db = SessionLocal()
+        try:
+            tickers = [t.ticker for t in db.query(TickerConfig).filter_by(is_active=1).all()]
+            existing = {lease.ticker for lease in db.query(TickerLease.ticker).all()}
+        finally:
+            db.close()
+
+        for ticker in tickers:
+            if ticker in existing:
+                continue
+            db = SessionLocal()
+            try:
+                db.add(TickerLease(ticker=ticker, attempts=0))
+                db.commit()
+            except IntegrityError:
+                # Another worker created it first
+                db.rollback()
+            finally:
+                db.close()
+
+    def claim_next(self, due_before: datetime, exclude: Iterable[str] = ()) -> Optional[TickerConfig]:
+        """
+        Claim the next active ticker not processed since due_before.
+
+        Tickers already claimed max_attempts times since due_before without
+        succeeding are skipped.
+
+        Args:
+            due_before: Tickers processed at or after this time are skipped
+            exclude: Tickers this worker already attempted and should not retry
+
+        Returns:
+            Claimed TickerConfig, or None when nothing is left to claim
+        """
+        db = SessionLocal()
+        try:
+            # Attempts made before this sweep do not count against it
+            attempts = case(
+                (or_(TickerLease.heartbeat_at.is_(None), TickerLease.heartbeat_at < due_before), 0),
+                else_=TickerLease.attempts
+            )
+
+            while True:
+                now = datetime.utcnow()
+                claimable = and_(
+                    or_(TickerLease.owner.is_(None), TickerLease.lease_expires_at < now),
+                    or_(TickerLease.processed_at.is_(None), TickerLease.processed_at < due_before),
+                    attempts < self.max_attempts
+                )
+                active = db.query(TickerConfig.ticker).filter_by(is_active=1)
+
+                candidate = db.query(TickerLease).filter(
+                    claimable, TickerLease.ticker.in_(active), TickerLease.ticker.notin_(list(exclude))
+                ).order_by(TickerLease.processed_at.is_(None).desc(), TickerLease.processed_at).first()
+
+                if candidate is None:
+                    return None
+
+                # Only one worker's conditional update can match the row
+                claimed = db.query(TickerLease).filter(
+                    TickerLease.id == candidate.id, claimable
+                ).update({
+                    TickerLease.owner: self.worker_id,
+                    TickerLease.lease_expires_at: now + timedelta(seconds=self.lease_seconds),
+                    TickerLease.heartbeat_at: now,
+                    TickerLease.attempts: attempts + 1
+                }, synchronize_session=False)
+                db.commit()
+
+                if claimed:
+                    return db.query(TickerConfig).filter_by(ticker=candidate.ticker).first()
+
+                db.expire_all()
+
+        except Exception as e:
+            print(f"Error claiming ticker: {e}")
+            db.rollback()
+            return None
+        finally:
+            db.close()
+
+    def heartbeat(self, ticker: str) -> bool:
+        """
+        Extend the lease on a claimed ticker.
+
+        Returns:
+            False if the lease was lost to another worker
+        """
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            extended = db.query(TickerLease).filter_by(ticker=ticker, owner=self.worker_id).update({
+                TickerLease.lease_expires_at: now + timedelta(seconds=self.lease_seconds),
+                TickerLease.heartbeat_at: now
+            }, synchronize_session=False)
+            db.commit()
+            return bool(extended)
+        except Exception as e:
+            print(f"Error extending lease on {ticker}: {e}")
+            db.rollback()
+            return True
+        finally:
+            db.close()
+
+    def release(self, ticker: str, success: bool, error: Optional[str] = None):
+        """
+        Release a claimed ticker, marking it processed on success.
+
+        Args:
+            ticker: Claimed ticker symbol
+            success: Whether processing completed
+            error: Error message to record on failure
+        """
+        values = {
+            TickerLease.owner: None,
+            TickerLease.lease_expires_at: None,
+            TickerLease.last_error: error
+        }
+        if success:
+            values[TickerLease.processed_at] = datetime.utcnow()
+            values[TickerLease.attempts] = 0
+
+        db = SessionLocal()
+        try:
+            db.query(TickerLease).filter_by(ticker=ticker, owner=self.worker_id).update(
+                values, synchronize_session=False
+            )
+            db.commit()
+        except Exception as e:
+            print(f"Error releasing lease on {ticker}: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def start_heartbeat(self, ticker: str, on_lost: Optional[Callable[[], None]] = None) -> threading.Event:
+        """
+        Heartbeat a ticker's lease in the background until the returned event is set.
+
+        Args:
+            ticker: Claimed ticker symbol
+            on_lost: Called from the heartbeat thread if the lease was lost to another worker
+
+        Returns:
+            Event to set once processing is finished
+        """
+        stop = threading.Event()
+        interval = max(self.lease_seconds / 3, 1)
+
+        def beat():
+            while not stop.wait(interval):
+                if not self.heartbeat(ticker):
+                    print(f"Lost lease on {ticker}")
+                    if on_lost is not None:
+                        on_lost()
+                    return
+
+        threading.Thread(target=beat, name=f'lease-{ticker}', daemon=True).start()
+        return stop
@@ -0,0 +1,89 @@
+"""Worker entry point for processing tickers in parallel across processes and hosts."""
+
+import argparse
+import multiprocessing
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+from backend.config.database import init_db
+from backend.services.pipeline import NewsPipeline
+from backend.services.ticker_leases import TickerLeaseManager
+
+
+def run_worker(max_articles: int, lease_seconds: int, loop: bool, interval: int, poll: int,
+               sweep_start: Optional[datetime] = None, max_attempts: int = 3):
+    """
+    Claim and process tickers until none are due.
+
+    Args:
+        max_articles: Maximum number of articles per ticker
+        lease_seconds: How long a claim stays valid without a heartbeat
+        loop: Keep polling for due tickers instead of exiting after one sweep
+        interval: In loop mode, seconds after which a processed ticker is due again
+        poll: In loop mode, seconds to sleep when no ticker is due
+        sweep_start: Without loop mode, the time the sweep began; tickers processed since
+            then are skipped. Must be shared by every worker in the sweep, defaults to now.
+        max_attempts: Claims of a failing ticker per sweep before it waits for the next one
+    """
+    lease_manager = TickerLeaseManager(lease_seconds=lease_seconds, max_attempts=max_attempts)
+    pipeline = NewsPipeline()
+    print(f"Worker {lease_manager.worker_id} started")
+
+    sweep_start = sweep_start or datetime.utcnow()
+
+    try:
+        while True:
+            due_before = datetime.utcnow() - timedelta(seconds=interval) if loop else sweep_start
+            results = pipeline.process_all_active_tickers(
+                max_articles=max_articles,
+                lease_manager=lease_manager,
+                due_before=due_before
+            )
+            print(f"Worker {lease_manager.worker_id} processed {len(results)} tickers")
+
+            if not loop:
+                break
+            if not results:
+                time.sleep(poll)
+    finally:
+        pipeline.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Process active tickers using database leases.')
+    parser.add_argument('--processes', type=int, default=1, help='Worker processes to start on this host')
+    parser.add_argument('--max-articles', type=int, default=10, help='Maximum articles per ticker')
+    parser.add_argument('--lease-seconds', type=int, default=300, help='Lease duration without heartbeat')
+    parser.add_argument('--loop', action='store_true', help='Keep running and reprocess tickers periodically')
+    parser.add_argument('--interval', type=int, default=900, help='Seconds before a ticker is due again (--loop)')
+    parser.add_argument('--poll', type=int, default=30, help='Seconds to wait when no ticker is due (--loop)')
+    parser.add_argument('--max-attempts', type=int, default=3, help='Tries of a failing ticker per sweep')
+    parser.add_argument('--due-before', help='UTC ISO time the sweep began; pass the same value to workers '
+                                             'on every host so none reprocesses a ticker finished in this sweep '
+                                             '(default: now)')
+    args = parser.parse_args()
+
+    init_db()
+
+    # One cutoff for all processes, so a late starter does not redo tickers finished in this sweep
+    sweep_start = datetime.fromisoformat(args.due_before) if args.due_before else datetime.utcnow()
+    if not args.loop:
+        print(f"Sweep of tickers not processed since {sweep_start.isoformat()} (UTC)")
+    worker_args = (args.max_articles, args.lease_seconds, args.loop, args.interval, args.poll, sweep_start,
+                   args.max_attempts)
+
+    if args.processes == 1:
+        run_worker(*worker_args)
+        return
+
+    # Spawn so each worker gets fresh database connections and its own models
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=run_worker, args=worker_args) for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+if __name__ == '__main__':
+    main()
@@ -27,14 +27,17 @@ function SentimentChart({ data }) {
   const tickers = Object.keys(data);
   const positiveData = [];
   const negativeData = [];
+  const neutralData = [];
 
   tickers.forEach(ticker => {
     const sentiments = data[ticker]?.sentiments || [];
     const positive = sentiments.find(s => s.label === 'POSITIVE');
     const negative = sentiments.find(s => s.label === 'NEGATIVE');
+    const neutral = sentiments.find(s => s.label === 'NEUTRAL');
 
     positiveData.push(positive ? positive.count : 0);
     negativeData.push(negative ? negative.count : 0);
+    neutralData.push(neutral ? neutral.count : 0);
   });
 
   const chartData = {
@@ -54,6 +57,13 @@ function SentimentChart({ data }) {
         borderColor: 'rgba(244, 67, 54, 1)',
         borderWidth: 1,
       },
+      {
+        label: 'Neutral',
+        data: neutralData,
+        backgroundColor: 'rgba(255, 152, 0, 0.8)',
+        borderColor: 'rgba(255, 152, 0, 1)',
+        borderWidth: 1,
+      },
     ],
   };
 
@@ -5,19 +5,24 @@ import './TickerCard.css';
 function TickerCard({ ticker, sentimentData }) {
   const getSentimentCounts = () => {
     if (!sentimentData || !sentimentData.sentiments) {
-      return { positive: 0, negative: 0, total: 0 };
+      return { positive: 0, negative: 0, neutral: 0, total: 0 };
     }
 
     const positive = sentimentData.sentiments.find(s => s.label === 'POSITIVE');
     const negative = sentimentData.sentiments.find(s => s.label === 'NEGATIVE');
+    const neutral = sentimentData.sentiments.find(s => s.label === 'NEUTRAL');
 
+    // Neutral articles are counted but left out of the positive/negative split
     return {
       positive: positive ? positive.count : 0,
       negative: negative ? negative.count : 0,
+      neutral: neutral ? neutral.count : 0,
       total: (positive?.count || 0) + (negative?.count || 0)
     };
   };
 
+  const hasArticles = (counts) => counts.total + counts.neutral > 0;
+
   const getSentimentPercentage = () => {
     const counts = getSentimentCounts();
     if (counts.total === 0) return 50;
@@ -54,6 +59,12 @@ function TickerCard({ ticker, sentimentData }) {
               <span className="count">{counts.negative}</span>
               <span className="label">Negative</span>
             </div>
+            {counts.neutral > 0 && (
+              <div className="sentiment-count neutral">
+                <span className="count">{counts.neutral}</span>
+                <span className="label">Neutral</span>
+              </div>
+            )}
           </div>
         </div>
 
@@ -63,7 +74,7 @@ function TickerCard({ ticker, sentimentData }) {
           </div>
         )}
 
-        {counts.total === 0 && (
+        {!hasArticles(counts) && (
           <div className="no-data">No recent articles</div>
         )}
       </div>
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
-import { getTickers, getSentimentSummary, processNews } from '../services/api';
+import { getTickers, getSentimentSummary, processNewsStream } from '../services/api';
 import SentimentChart from '../components/SentimentChart';
 import TickerCard from '../components/TickerCard';
 import './Dashboard.css';
@@ -10,6 +10,7 @@ function Dashboard() {
   const [sentimentData, setSentimentData] = useState({});
   const [loading, setLoading] = useState(true);
   const [processing, setProcessing] = useState(false);
+  const [progress, setProgress] = useState(null);
   const [error, setError] = useState(null);
   const [successMessage, setSuccessMessage] = useState(null);
 
@@ -51,7 +52,15 @@ function Dashboard() {
       setError(null);
       setSuccessMessage(null);
 
-      await processNews('all', 10);
+      let processed = 0;
+      await processNewsStream('all', 10, (event, data) => {
+        if (event === 'stage') {
+          setProgress(`${data.ticker}: ${data.stage}...`);
+        } else if (event === 'article') {
+          processed += 1;
+          setProgress(`${data.ticker}: ${data.index}/${data.total} analyzed (${processed} articles so far)`);
+        }
+      });
 
       setSuccessMessage('Successfully processed news for all tickers!');
 
@@ -65,6 +74,7 @@ function Dashboard() {
       setError('Failed to process news: ' + err.message);
     } finally {
       setProcessing(false);
+      setProgress(null);
     }
   };
 
@@ -89,6 +99,7 @@ function Dashboard() {
         </button>
       </div>
 
+      {progress && <div className="success-message">{progress}</div>}
       {error && <div className="error-message">{error}</div>}
       {successMessage && <div className="success-message">{successMessage}</div>}
 
@@ -28,6 +28,55 @@ export const getSentimentSummary = (ticker = null, days = 7) =>
 export const processNews = (tickers = 'all', maxArticles = 10) =>
   api.post('/process', { tickers, max_articles: maxArticles });
 
+// Streams server-sent events from /process/stream, calling onEvent(event, data)
+// for each one. Resolves with the final 'done' payload; rejects on 'error' or if
+// the stream closes before 'done' arrives.
+export const processNewsStream = async (tickers = 'all', maxArticles = 10, onEvent = () => {}) => {
+  const response = await fetch(`${API_BASE_URL}/process/stream`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ tickers, max_articles: maxArticles }),
+  });
+  if (!response.ok) {
+    throw new Error(`Request failed with status ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result = null;
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    const messages = buffer.split('\n\n');
+    buffer = messages.pop();
+    for (const message of messages) {
+      let event = 'message';
+      let data = '';
+      message.split('\n').forEach(line => {
+        if (line.startsWith('event: ')) event = line.slice(7);
+        else if (line.startsWith('data: ')) data += line.slice(6);
+      });
+      const payload = data ? JSON.parse(data) : {};
+
+      if (event === 'error') {
+        await reader.cancel();
+        throw new Error(payload.error);
+      }
+      if (event === 'done') result = payload;
+      onEvent(event, payload);
+    }
+  }
+
+  if (result === null) {
+    throw new Error('Processing stream closed before completion');
+  }
+  return result;
+};
+
 // Health
 export const healthCheck = () => api.get('/health');
 